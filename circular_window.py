@@ -5,8 +5,28 @@ import win32api
 import math
 import time
 import ctypes
+import numpy as np
 from ctypes import wintypes, Structure, sizeof, POINTER, byref
 
+def _arc_points(cx, cy, radius, c, s, dc, ds, n, out):
+    """Fill out[:n] with arc points advanced by the angle-addition recurrence.
+
+    Kept as a plain numeric function over a preallocated array so it can be
+    JIT-compiled with numba when available (see CircularWindow._get_arc_fn).
+    """
+    for i in range(n):
+        out[i, 0] = cx + radius * c
+        out[i, 1] = cy + radius * s
+        c, s = c * dc - s * ds, s * dc + c * ds
+
+EVENT_SYSTEM_FOREGROUND = 0x0003
+WINEVENT_OUTOFCONTEXT = 0x0000
+
+# Signature of a WINEVENTPROC callback for SetWinEventHook
+_WinEventProc = ctypes.WINFUNCTYPE(
+    None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+    wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD)
+
 class FLASHWINFO(Structure):
     _fields_ = [
         ("cbSize", ctypes.c_uint),
@@ -53,18 +73,50 @@ class CircularWindow:
                             size, size,
                             win32con.SWP_SHOWWINDOW)
 
+        # Pre-bound Win32 calls for the hot mouse path. Binding once avoids
+        # re-resolving the ctypes/pywin32 attribute chains on every event.
+        self._GetCursorPos = ctypes.windll.user32.GetCursorPos
+        self._GetCursorPos.argtypes = [POINTER(wintypes.POINT)]
+        self._GetCursorPos.restype = wintypes.BOOL
+        self._cursor_pt = wintypes.POINT()
+        self._SetWindowPos = win32gui.SetWindowPos
+        self._GetWindowRect = win32gui.GetWindowRect
+        self._GetAsyncKeyState = ctypes.windll.user32.GetAsyncKeyState
+        self._GetAsyncKeyState.argtypes = [ctypes.c_int]
+        self._GetAsyncKeyState.restype = ctypes.c_short
+
         # Window dragging state
         self.dragging = False
         self.drag_offset = None
+        self._last_move_ts = 0.0
+        # Skip the bitblt/redraw work during drag moves; pygame repaints the
+        # window on the next frame anyway
+        self._drag_swp_flags = (win32con.SWP_NOSIZE | win32con.SWP_NOZORDER |
+                                win32con.SWP_NOACTIVATE | win32con.SWP_NOSENDCHANGING |
+                                win32con.SWP_NOCOPYBITS | win32con.SWP_NOREDRAW)
         
         # Closing animation state
         self.escape_start = None
         self.escape_held = False
         self.escape_duration = 1.5  # Shortened from 2.0 to 1.5 seconds
-        self.close_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        self.close_surface = pygame.Surface((size, size), pygame.SRCALPHA)  # Reusable sector-mask buffer
+        self._ring_cache = {}  # Pre-rendered full rings keyed by int radius
+        # Rotation step for the sector outline: one point every 2 degrees,
+        # advanced via the angle-addition recurrence instead of per-point trig
+        arc_step = math.radians(2)
+        self._arc_dc = math.cos(arc_step)
+        self._arc_ds = math.sin(arc_step)
+        self._arc_buf = np.empty((182, 2), dtype=np.float64)  # One slot per 2 degrees plus endpoints
+        self._arc_fn = None  # Resolved lazily on first Escape press
         
-        # Focus state
+        # Focus state, kept current by a WinEvent hook on foreground changes
+        # instead of polling GetForegroundWindow every frame. The callback
+        # reference must stay alive for the lifetime of the hook.
         self.has_focus = True
+        self._win_event_proc = _WinEventProc(self._on_foreground_change)
+        self._foreground_hook = ctypes.windll.user32.SetWinEventHook(
+            EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_FOREGROUND,
+            0, self._win_event_proc, 0, 0, WINEVENT_OUTOFCONTEXT)
 
         # Size interpolation
         self.max_radius = size//2
@@ -72,85 +124,144 @@ class CircularWindow:
         self.current_radius = self.max_radius
         self.target_radius = self.max_radius
         self.size_transition_speed = 8.0
+        # The exponential smoothing factor is constant for a fixed 60 Hz
+        # step, so evaluate the exp once; set_transition_speed recomputes it
+        self._lerp_alpha = 1 - math.exp(-self.size_transition_speed / 60.0)
         self.expanded = True
+        # Squared-radius thresholds for sqrt-free hit tests, kept in sync
+        # with current_radius by update_size
+        self._r2 = self.current_radius * self.current_radius
+        self._r2_over_9 = self._r2 / 9
+
+        # Dirty-region tracking for partial display updates
+        self._prev_bbox = None
 
     def create_circular_region(self):
         """Create circular region for the window"""
         region = win32gui.CreateRoundRectRgn(0, 0, self.size, self.size, self.size, self.size)
         win32gui.SetWindowRgn(self.hwnd, region, True)
 
+    def _get_arc_fn(self):
+        """Get the arc-point generator, JIT-compiling it on first use.
+
+        numba import and compilation are deferred until the first Escape
+        press so they never delay startup; without numba the pure-Python
+        generator is used as-is.
+        """
+        fn = self._arc_fn
+        if fn is None:
+            try:
+                from numba import njit
+                fn = njit(cache=True)(_arc_points)
+            except ImportError:
+                fn = _arc_points
+            self._arc_fn = fn
+        return fn
+
+    def _get_ring(self, radius):
+        """Get the full closing ring for a radius, rendering it on first use"""
+        ring = self._ring_cache.get(radius)
+        if ring is None:
+            ring = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+            pygame.draw.circle(ring, (255, 80, 80, 255),
+                               (self.size//2, self.size//2), radius, 6)
+            # Each ring is a full size x size surface, and a hold overlapping
+            # a radius transition sweeps many integer radii, so keep only the
+            # few most recent (the settled min/max rings get re-added cheaply)
+            if len(self._ring_cache) > 8:
+                self._ring_cache.pop(next(iter(self._ring_cache)))
+            self._ring_cache[radius] = ring
+        return ring
+
     def draw_closing_animation(self):
         if not self.escape_held or self.escape_start is None:
             return
-            
+
         progress = min(1.0, (time.time() - self.escape_start) / self.escape_duration)
-        
-        # Clear the close surface
-        self.close_surface.fill((0,0,0,0))
-        
-        # Draw the arc using current_radius instead of fixed size
+
+        # Reveal a slice of the pre-rendered ring through a pie-sector alpha
+        # mask instead of rasterizing a thick polyline every frame
         center = (self.size//2, self.size//2)
-        radius = self.current_radius - 4  # Adjust radius to be slightly smaller than window
-        
+        radius = int(self.current_radius - 4)  # Slightly smaller than window
+        ring = self._get_ring(radius)
+
+        if progress >= 1.0:
+            self.surface.blit(ring, (0, 0))
+            return
+
+        # Build the sector outline with the recurrence cos(a+d) = c*dc - s*ds,
+        # sin(a+d) = s*dc + c*ds, so only two trig calls run per frame; the
+        # point loop itself runs JIT-compiled when numba is available
+        cx, cy = center
         start_angle = -math.pi/2  # Start from top
-        end_angle = start_angle + (2 * math.pi * progress)
-        
-        # Draw the arc with anti-aliasing
-        points = []
-        for angle in range(int(math.degrees(start_angle)), int(math.degrees(end_angle)), 2):
-            rad = math.radians(angle)
-            x = center[0] + radius * math.cos(rad)
-            y = center[1] + radius * math.sin(rad)
-            points.append((x, y))
-            
-        if len(points) > 1:
-            pygame.draw.lines(self.close_surface, (255, 80, 80, 255), False, points, 6)  # Increased thickness
-        
-        # Blend the closing animation
-        self.surface.blit(self.close_surface, (0, 0))
+        c, s = math.cos(start_angle), math.sin(start_angle)
+        reach = radius + 8  # Keep the sector corners outside the ring stroke
+        n = int(360 * progress) // 2 + 1
+        buf = self._arc_buf
+        self._get_arc_fn()(cx, cy, reach, c, s, self._arc_dc, self._arc_ds, n, buf)
+        points = [center] + buf[:n].tolist()
+
+        if len(points) > 2:
+            # Clear only the ring's bounding box; stale mask pixels outside it
+            # multiply against transparent ring pixels and stay invisible
+            mask_bbox = pygame.Rect(cx - reach - 2, cy - reach - 2,
+                                    2*reach + 4, 2*reach + 4)
+            self.close_surface.fill((0,0,0,0), mask_bbox)
+            pygame.draw.polygon(self.close_surface, (255, 255, 255, 255), points)
+            revealed = ring.copy()
+            revealed.blit(self.close_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            self.surface.blit(revealed, (0, 0))
 
     def get_cursor_pos(self):
         """Get the current cursor position using Win32 API"""
-        point = wintypes.POINT()
-        ctypes.windll.user32.GetCursorPos(ctypes.byref(point))
+        point = self._cursor_pt
+        self._GetCursorPos(byref(point))
         return point.x, point.y
 
-    def update_window_pos(self):
+    def update_window_pos(self, final=False):
         if not self.dragging or self.drag_offset is None:
             return
-            
+
+        # Clamp reposition cadence to ~120 Hz; drag release sends one final
+        # unthrottled move so the window never settles short of the cursor
+        now = time.perf_counter()
+        if not final and now - self._last_move_ts < 1/120:
+            return
+        self._last_move_ts = now
+
         # Get current cursor position
         cursor_x, cursor_y = self.get_cursor_pos()
-        
+
         # Calculate new window position based on cursor and initial offset
         new_x = cursor_x - self.drag_offset[0]
         new_y = cursor_y - self.drag_offset[1]
-        
+
         # Update window position
-        win32gui.SetWindowPos(self.hwnd, 0, int(new_x), int(new_y), 0, 0, 
-                             win32con.SWP_NOSIZE | win32con.SWP_NOZORDER)
+        self._SetWindowPos(self.hwnd, 0, int(new_x), int(new_y), 0, 0,
+                           self._drag_swp_flags)
 
-    def lerp(self, start, end, t):
-        """Linear interpolation between two values"""
-        return start + (end - start) * t
+    def set_transition_speed(self, speed):
+        """Set the radius transition speed and refresh the cached smoothing factor"""
+        self.size_transition_speed = speed
+        self._lerp_alpha = 1 - math.exp(-speed / 60.0)
 
     def update_size(self):
         """Update current radius with smooth interpolation"""
         if abs(self.current_radius - self.target_radius) > 0.1:
-            dt = 1/60  # Assuming 60 FPS
-            self.current_radius = self.lerp(
-                self.current_radius,
-                self.target_radius,
-                1 - math.exp(-self.size_transition_speed * dt)
-            )
+            self.current_radius += (self.target_radius - self.current_radius) * self._lerp_alpha
+            self._r2 = self.current_radius * self.current_radius
+            self._r2_over_9 = self._r2 / 9
 
     def handle_window_click(self, pos):
         """Handle window expansion/collapse on click. Returns True if click was handled."""
         if not self.expanded:
-            center = (self.size//2, self.size//2)
-            if math.dist(pos, center) <= self.current_radius:
+            # Compare squared distances so no sqrt runs on the click path
+            dx = pos[0] - self.size//2
+            dy = pos[1] - self.size//2
+            d2 = dx*dx + dy*dy
+            if d2 <= self._r2:
                 # Only expand if clicked in the center area (1/3 of radius)
-                if math.dist(pos, center) <= self.current_radius/3:
+                if d2 <= self._r2_over_9:
                     self.expanded = True
                     self.target_radius = self.max_radius
                     return True
@@ -158,29 +269,35 @@ class CircularWindow:
 
     def process_parent_events(self, events):
         """Process basic window events. Returns False if window should close."""
-        # Check if window has focus
-        self.has_focus = self.hwnd == win32gui.GetForegroundWindow()
-        
+        # Coalesce mouse motion: only the newest cursor position matters, and
+        # high-polling mice can queue many motions per rendered frame, each of
+        # which would trigger its own SetWindowPos while dragging
+        motions = [e for e in events if e.type == pygame.MOUSEMOTION]
+        if len(motions) > 1:
+            events = [e for e in events if e.type != pygame.MOUSEMOTION]
+            events.append(motions[-1])
+
         # Update size based on focus
         if not self.has_focus and self.expanded:
             self.expanded = False
             self.target_radius = self.min_radius
         
+        # Poll Escape directly instead of relying on KEYDOWN/KEYUP: SDL can
+        # drop the KEYUP when the window loses foreground mid-hold, which
+        # would leave escape_held stuck. GetAsyncKeyState is system-wide, so
+        # gate on focus to keep the close gesture scoped to this window.
+        escape_pressed = self.has_focus and bool(self._GetAsyncKeyState(0x1B) & 0x8000)  # VK_ESCAPE
+        if escape_pressed and not self.escape_held:
+            self.escape_start = time.time()
+            self.escape_held = True
+        elif not escape_pressed and self.escape_held:
+            self.escape_held = False
+            self.escape_start = None
+
         for event in events:
             if event.type == pygame.QUIT:
                 return False
-                
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    if not self.escape_held:
-                        self.escape_start = time.time()
-                        self.escape_held = True
-                    
-            elif event.type == pygame.KEYUP:
-                if event.key == pygame.K_ESCAPE:
-                    self.escape_held = False
-                    self.escape_start = None
-                    
+
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
                     # Handle window expansion first
@@ -189,15 +306,17 @@ class CircularWindow:
                         
                     # If not handled by expansion, handle dragging
                     # Check if click is within the current window radius
-                    center = (self.size//2, self.size//2)
-                    if math.dist(event.pos, center) <= self.current_radius:
-                        win_rect = win32gui.GetWindowRect(self.hwnd)
+                    dx = event.pos[0] - self.size//2
+                    dy = event.pos[1] - self.size//2
+                    if dx*dx + dy*dy <= self._r2:
+                        win_rect = self._GetWindowRect(self.hwnd)
                         cursor_x, cursor_y = self.get_cursor_pos()
                         self.drag_offset = (cursor_x - win_rect[0], cursor_y - win_rect[1])
                         self.dragging = True
                     
             elif event.type == pygame.MOUSEBUTTONUP:
                 if event.button == 1:  # Left click release
+                    self.update_window_pos(final=True)
                     self.dragging = False
                     self.drag_offset = None
                     
@@ -217,11 +336,24 @@ class CircularWindow:
         return self.process_parent_events(pygame.event.get())
 
     def update(self):
-        """Update the display"""
-        pygame.display.flip()
+        """Push only the dirty region around the circle to the display"""
+        r = int(self.current_radius) + 8
+        center = self.size // 2
+        bbox = pygame.Rect(center - r, center - r, 2 * r, 2 * r)
+        # Union with the previous frame's bbox so shrinking circles get erased
+        dirty = bbox.union(self._prev_bbox) if self._prev_bbox else bbox
+        self._prev_bbox = bbox
+        pygame.display.update(dirty)
+
+    def _on_foreground_change(self, hook, event, hwnd, id_object, id_child, thread, timestamp):
+        """WinEvent callback fired when the foreground window changes"""
+        self.has_focus = hwnd == self.hwnd
 
     def quit(self):
-        """Clean up pygame"""
+        """Clean up the focus hook and pygame"""
+        if self._foreground_hook:
+            ctypes.windll.user32.UnhookWinEvent(self._foreground_hook)
+            self._foreground_hook = None
         pygame.quit()
 
     def flash_taskbar(self):
@@ -5,29 +5,23 @@ import argparse
 import win32gui
 import colorsys
 import math
-
-def lerp_color(color1, color2, t):
-    """Linearly interpolate between two colors"""
-    return tuple(int(a + (b - a) * t) for a, b in zip(color1, color2))
+import numpy as np
 
 def lerp(start, end, t):
     """Linear interpolation between two values"""
     return start + (end - start) * t
 
-def get_brightness(color):
-    """Get perceived brightness of a color (0-255)"""
-    # Using perceived brightness formula: (0.299*R + 0.587*G + 0.114*B)
-    return int(0.299 * color[0] + 0.587 * color[1] + 0.114 * color[2])
-
 class TimerWindow(CircularWindow):
     def __init__(self, size=400, initial_minutes=5, autostart=False, bg_color=(0, 120, 255), description=None):
         super().__init__(size, "Timer")
         
         # Initialize fonts
         pygame.font.init()
-        self.font = pygame.font.SysFont('Arial', size//5)
-        self.button_font = pygame.font.SysFont('Arial', size//16)
-        self.desc_font = pygame.font.SysFont('Arial', size//10)
+        self._font_cache = {}  # Memoized SysFont instances keyed by pixel size
+        self._text_cache = {}  # Pre-rendered text surfaces, key fully determines pixels
+        self.font = self._font(size//5)
+        self.button_font = self._font(size//16)
+        self.desc_font = self._font(size//10)
         
         # Colors
         self.BLACK = (0, 0, 0, 255)
@@ -35,11 +29,17 @@ class TimerWindow(CircularWindow):
         self.GRAY = (128, 128, 128, 255)
         self.RED = (255, 60, 60, 255)
         self.bg_color = tuple(list(bg_color) + [255])  # Add alpha channel
+        # Float arrays for vectorized background/flash color interpolation
+        self._bg = np.array(self.bg_color[:3], dtype=np.float32)
+        self._red = np.array(self.RED[:3], dtype=np.float32)
         
-        # Timer state
+        # Timer state. Remaining time is derived from a monotonic deadline
+        # rather than accumulated wall-clock deltas, so the countdown is
+        # immune to clock jumps and needs no per-frame bookkeeping.
         self.seconds = max(60, min(5400, initial_minutes * 60))  # Between 1 and 90 minutes
         self.running = autostart
-        self.last_update = time.time()
+        self._run_started = time.perf_counter() if autostart else None
+        self._run_seconds_at_start = self.seconds
         self.finished = False
         self.flash_time = 0
         self.flash_interval = 0.5
@@ -56,10 +56,137 @@ class TimerWindow(CircularWindow):
             'down': pygame.Rect(size*0.2, size//2 - btn_height//2, btn_height, btn_height)
         }
         self.buttons = self.original_buttons.copy()
+        self._btn_geom_cache = {}  # Scaled button rects keyed by int radius
         
         # Click handling state
         self.click_handled = False
 
+        # Signature of the last drawn frame, used to skip redundant redraws
+        self._state_sig = None
+
+        # Pre-rendered background + buttons surfaces keyed by visual state
+        self._chrome_cache = {}
+
+        # Digit atlases keyed by (px, color): every glyph the clock can show,
+        # rasterized once, stamped by sub-rect blits
+        self._atlas_cache = {}
+
+    def _font(self, px):
+        """Get a cached Arial font for the given pixel size"""
+        px &= ~1  # Quantize to even sizes so the cache stays small during transitions
+        font = self._font_cache.get(px)
+        if font is None:
+            font = pygame.font.SysFont('Arial', px)
+            self._font_cache[px] = font
+        return font
+
+    def _render(self, font, text, color, key):
+        """Render text through the surface cache, rasterizing only on a miss"""
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            if len(self._text_cache) > 64:
+                self._text_cache.pop(next(iter(self._text_cache)))
+            self._text_cache[key] = surf
+        return surf
+
+    def _button_geom(self, radius_int):
+        """Get scaled button rects and corner radii for a radius, built on first use"""
+        geom = self._btn_geom_cache.get(radius_int)
+        if geom is None:
+            size_ratio = radius_int / self.max_radius
+            center = (self.size//2, self.size//2)
+            btn_positions = {
+                'start': (center[0], center[1] + radius_int * 0.4),
+                'reset': (center[0], center[1] + radius_int * 0.6),
+                'up': (center[0] + radius_int * 0.5, center[1]),
+                'down': (center[0] - radius_int * 0.5, center[1])
+            }
+            geom = {}
+            for btn_name, original_rect in self.original_buttons.items():
+                rect = pygame.Rect(
+                    0, 0,
+                    original_rect.width * size_ratio,
+                    original_rect.height * size_ratio
+                )
+                rect.center = btn_positions[btn_name]
+                geom[btn_name] = (rect, int(rect.height//2))
+            self._btn_geom_cache[radius_int] = geom
+        return geom
+
+    def _digit_atlas(self, px, color):
+        """Get the '0'-'9' + ':' glyph atlas for one size/color, built on first use.
+
+        Glyphs sit in fixed-width cells so the clock doesn't jitter as digits
+        change. Returns (surface, cell rects, cell width, cell height).
+        """
+        px &= ~1  # Match _font's quantization so equal-font sizes share one atlas
+        key = (px, color)
+        atlas = self._atlas_cache.get(key)
+        if atlas is None:
+            font = self._font(px)
+            glyphs = [font.render(ch, True, color) for ch in '0123456789:']
+            cell_w = max(g.get_width() for g in glyphs)
+            cell_h = max(g.get_height() for g in glyphs)
+            surf = pygame.Surface((cell_w * len(glyphs), cell_h), pygame.SRCALPHA)
+            cells = []
+            for i, g in enumerate(glyphs):
+                surf.blit(g, (i * cell_w + (cell_w - g.get_width()) // 2,
+                              (cell_h - g.get_height()) // 2))
+                cells.append(pygame.Rect(i * cell_w, 0, cell_w, cell_h))
+            atlas = (surf, cells, cell_w, cell_h)
+            if len(self._atlas_cache) > 16:
+                self._atlas_cache.pop(next(iter(self._atlas_cache)))
+            self._atlas_cache[key] = atlas
+        return atlas
+
+    def _build_chrome(self, radius_int, bg, text_color, size_ratio):
+        """Render the static background, description and buttons for one state"""
+        chrome = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+        center = (self.size//2, self.size//2)
+
+        # At full size the Win32 region already clips the window to a circle,
+        # so a rectangular SIMD fill produces identical visible pixels without
+        # rasterizing a disc; smaller radii still need the circle since they
+        # don't reach the region edge.
+        if radius_int >= self.max_radius:
+            chrome.fill(bg)
+        else:
+            pygame.draw.circle(chrome, bg, center, radius_int)
+
+        if not self.expanded:
+            return chrome
+
+        # Collect text stamps and issue them as one batched blit; fblits is
+        # the low-overhead path on current pygame, older versions fall back
+        # to blits
+        text_blits = []
+
+        if self.description:
+            desc_px = max(10, int(self.size//10 * size_ratio))
+            desc_text = self._render(self._font(desc_px), self.description, text_color,
+                                     ('desc', self.description, text_color, desc_px))
+            text_blits.append((desc_text, desc_text.get_rect(center=center)))
+
+        btn_px = max(8, int(self.size//16 * size_ratio))
+        btn_font = self._font(btn_px)
+        for btn_name, (scaled_rect, border_radius) in self._button_geom(radius_int).items():
+            text = btn_name.upper()
+            if btn_name == 'start':
+                text = 'STOP' if self.running else 'START'
+            elif btn_name == 'up':
+                text = '+'
+            elif btn_name == 'down':
+                text = '-'
+
+            pygame.draw.rect(chrome, self.GRAY, scaled_rect, border_radius=border_radius)
+            btn_text = self._render(btn_font, text, text_color,
+                                    ('btn', text, text_color, btn_px))
+            text_blits.append((btn_text, btn_text.get_rect(center=scaled_rect.center)))
+
+        getattr(chrome, 'fblits', chrome.blits)(text_blits)
+        return chrome
+
     def format_time(self):
         minutes = self.seconds // 60
         secs = self.seconds % 60
@@ -68,90 +195,86 @@ class TimerWindow(CircularWindow):
     def draw(self):
         # Update size interpolation from parent class
         self.update_size()
-        
-        # Clear surface
-        self.surface.fill((0,0,0,0))
-        
-        # Calculate current background color
-        current_bg = self.bg_color
+
+        # Skip the redraw entirely when nothing visible has changed
+        state_sig = (
+            self.seconds,
+            self.running,
+            self.expanded,
+            int(self.current_radius * 4),
+            int(time.time() * 8) if self.finished else 0,
+            int(time.time() * 60) if self.escape_held else 0,
+        )
+        if state_sig == self._state_sig:
+            return
+        self._state_sig = state_sig
+
+        # Calculate current background color as a single vectorized lerp
+        cur = self._bg
         if self.finished:
             t = (math.sin(time.time() * 4) + 1) / 2  # Oscillate between 0 and 1
-            current_bg = lerp_color(self.bg_color[:3], self.RED[:3], t) + (255,)
-        
-        # Determine text color based on background brightness
-        bg_brightness = get_brightness(current_bg)
+            cur = self._bg + (self._red - self._bg) * t
+        current_bg = tuple(cur.astype(np.uint8)) + (255,)
+
+        # Determine text color based on perceived background brightness
+        bg_brightness = int(0.299 * cur[0] + 0.587 * cur[1] + 0.114 * cur[2])
         text_color = self.BLACK if bg_brightness > 128 else self.WHITE
         
         # Calculate size ratio for scaling elements
         size_ratio = self.current_radius / self.max_radius
         center = (self.size//2, self.size//2)
         
-        # Draw main circle
-        pygame.draw.circle(self.surface, current_bg, center, int(self.current_radius))
-        
+        # Blit the cached chrome (background, description, buttons) for this
+        # state; only the time text is stamped dynamically on top
+        radius_int = int(self.current_radius)
+        chrome_key = (radius_int, current_bg, text_color, self.running, self.expanded)
+        chrome = self._chrome_cache.get(chrome_key)
+        if chrome is None:
+            chrome = self._build_chrome(radius_int, current_bg, text_color, size_ratio)
+            if len(self._chrome_cache) > 32:
+                self._chrome_cache.pop(next(iter(self._chrome_cache)))
+            self._chrome_cache[chrome_key] = chrome
+
+        # Clear only the pixels the circle can occupy; the union with the
+        # previous frame's bbox erases the larger disc while shrinking
+        r = radius_int + 8
+        clear_bbox = pygame.Rect(center[0] - r, center[1] - r, 2*r, 2*r)
+        if self._prev_bbox:
+            clear_bbox = clear_bbox.union(self._prev_bbox)
+        self.surface.fill((0,0,0,0), clear_bbox)
+        self.surface.blit(chrome, (0, 0))
+
+        # Keep click-detection rects in sync with the drawn geometry
+        if self.expanded:
+            for btn_name, (scaled_rect, _) in self._button_geom(radius_int).items():
+                self.buttons[btn_name] = scaled_rect
+
         # Draw time with consistent size in mini mode
         if self.expanded:
             font_size = int(self.size//5 * size_ratio)
         else:
             font_size = self.size//8  # Keep time text size consistent in mini mode
         
-        time_font = pygame.font.SysFont('Arial', max(12, font_size))
-        time_text = time_font.render(self.format_time(), True, text_color)
-        time_rect = time_text.get_rect(center=(center[0], center[1] - font_size//2 if self.expanded else center[1]))
-        self.surface.blit(time_text, time_rect)
-        
-        if self.expanded:
-            # Draw description if provided
-            if self.description:
-                desc_font_size = int(self.size//10 * size_ratio)
-                desc_font = pygame.font.SysFont('Arial', max(10, desc_font_size))
-                desc_text = desc_font.render(self.description, True, text_color)
-                desc_rect = desc_text.get_rect(center=(center[0], center[1]))
-                self.surface.blit(desc_text, desc_rect)
-            
-            # Draw buttons
-            btn_positions = {
-                'start': (center[0], center[1] + self.current_radius * 0.4),
-                'reset': (center[0], center[1] + self.current_radius * 0.6),
-                'up': (center[0] + self.current_radius * 0.5, center[1]),
-                'down': (center[0] - self.current_radius * 0.5, center[1])
-            }
-            
-            for btn_name, original_rect in self.original_buttons.items():
-                color = self.GRAY
-                text = btn_name.upper()
-                if btn_name == 'start':
-                    text = 'STOP' if self.running else 'START'
-                elif btn_name == 'up':
-                    text = '+'
-                elif btn_name == 'down':
-                    text = '-'
-                
-                # Scale and position buttons
-                scaled_rect = pygame.Rect(
-                    0, 0,
-                    original_rect.width * size_ratio,
-                    original_rect.height * size_ratio
-                )
-                scaled_rect.center = btn_positions[btn_name]
-                
-                pygame.draw.rect(self.surface, color, scaled_rect, border_radius=int(scaled_rect.height//2))
-                btn_font_size = int(self.size//16 * size_ratio)
-                btn_font = pygame.font.SysFont('Arial', max(8, btn_font_size))
-                btn_text = btn_font.render(text, True, text_color)
-                btn_text_rect = btn_text.get_rect(center=scaled_rect.center)
-                self.surface.blit(btn_text, btn_text_rect)
-                
-                # Update button rect for click detection
-                self.buttons[btn_name] = scaled_rect
-        
+        # Stamp the time from the digit atlas: no Freetype work per frame,
+        # just one batched sub-rect blit per glyph
+        time_px = max(12, font_size)
+        atlas, cells, cell_w, cell_h = self._digit_atlas(time_px, text_color)
+        text = self.format_time()
+        x = center[0] - (cell_w * len(text)) // 2
+        y = (center[1] - font_size//2 if self.expanded else center[1]) - cell_h // 2
+        self.surface.blits(
+            [(atlas, (x + i * cell_w, y), cells[10 if ch == ':' else ord(ch) - 48])
+             for i, ch in enumerate(text)], doreturn=0)
+
         # Draw closing animation if needed
         self.draw_closing_animation()
         
-        # Update display
-        self.screen.fill(self.BLACK)
+        # Copy only the dirty region to the display surface; update() pushes
+        # the matching rect, so pixels outside it are never read or written.
+        # In mini mode this cuts the copied area by up to ~25x.
+        self.screen.fill(self.BLACK, clear_bbox)
         self.surface.set_alpha(255)
-        self.screen.blit(self.surface, (0,0))
+        self.screen.blit(self.surface, clear_bbox, clear_bbox)
         self.update()
 
     def handle_button_click(self, pos):
@@ -163,7 +286,9 @@ class TimerWindow(CircularWindow):
             if btn_rect.collidepoint(pos):
                 if btn_name == 'start':
                     self.running = not self.running
-                    self.last_update = time.time()
+                    if self.running:
+                        self._run_started = time.perf_counter()
+                        self._run_seconds_at_start = self.seconds
                     if self.finished:  # Reset finished state when starting again
                         self.finished = False
                 elif btn_name == 'reset':
@@ -206,15 +331,12 @@ class TimerWindow(CircularWindow):
 
     def update_timer(self):
         if self.running:
-            current_time = time.time()
-            elapsed = current_time - self.last_update
-            if elapsed >= 1.0:
-                self.seconds = max(0, self.seconds - int(elapsed))
-                self.last_update = current_time
-                if self.seconds == 0:
-                    self.running = False
-                    self.finished = True
-                    self.flash_taskbar()  # Flash taskbar when timer finishes
+            elapsed = int(time.perf_counter() - self._run_started)
+            self.seconds = max(0, self._run_seconds_at_start - elapsed)
+            if self.seconds == 0:
+                self.running = False
+                self.finished = True
+                self.flash_taskbar()  # Flash taskbar when timer finishes
 
 def main():
     parser = argparse.ArgumentParser(description='Circular Timer')
@@ -239,11 +361,18 @@ def main():
 
     timer = TimerWindow(400, args.minutes, args.start, bg_color, args.description)
     running = True
-    
+    clock = pygame.time.Clock()
+
     while running:
         timer.update_timer()
         timer.draw()
         running = timer.handle_events()
+        # Run at full rate only while something animates; when the display
+        # changes at most once a second, a slow cadence still catches every
+        # tick while keeping click latency imperceptible
+        animating = (timer.dragging or timer.finished or timer.escape_held or
+                     abs(timer.current_radius - timer.target_radius) > 0.1)
+        clock.tick(60 if animating else 10)
     
     timer.quit()
 